@@ -1,18 +1,22 @@
 import string
 import random
 
+CHARACTERS = string.ascii_letters + string.digits + string.punctuation
+
 def generate_password(length):
-    characters = string.ascii_letters + string.digits + string.punctuation
-    password = ''.join(random.choice(characters) for _ in range(length))
-    return password
+    return ''.join(random.choices(CHARACTERS, k=length))
 
 while True:
     # Example usage
-    password_length = int(input("Enter the desired password length: "))
+    try:
+        password_length = int(input("Enter the desired password length: "))
+    except ValueError:
+        print("Please enter a whole number.")
+        continue
     password = generate_password(password_length)
     print("Generated password:", password)
 
     # Ask user if they want to generate another password
     repeat = input("Press Enter to generate another password or type 'exit' to quit: ").lower()
     if repeat == 'exit':
-        break
\ No newline at end of file
+        break